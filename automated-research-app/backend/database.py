@@ -3,10 +3,8 @@ PostgreSQL database manager for automated research app
 Production-ready database layer using Neon PostgreSQL
 """
 import os
-from typing import Optional, List, Dict, Any, Union
 from contextlib import contextmanager
 import logging
-from datetime import datetime
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -135,17 +133,26 @@ class DatabaseManager:
             '''
         ]
         
-        for query in queries:
-            self.execute_query(query)
+        # Run schema setup and migrations in a single transaction on one connection
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            for query in queries:
+                cursor.execute(query)
+            
+            # Run migrations to update existing tables
+            for query in migration_queries:
+                cursor.execute("SAVEPOINT migration")
+                try:
+                    cursor.execute(query)
+                    cursor.execute("RELEASE SAVEPOINT migration")
+                    logger.info("Successfully applied database migration")
+                except Exception as e:
+                    # Migration might fail if columns are already the right type
+                    cursor.execute("ROLLBACK TO SAVEPOINT migration")
+                    logger.info(f"Migration skipped (likely already applied): {e}")
             
-        # Run migrations to update existing tables
-        for query in migration_queries:
-            try:
-                self.execute_query(query)
-                logger.info("Successfully applied database migration")
-            except Exception as e:
-                # Migration might fail if columns are already the right type
-                logger.info(f"Migration skipped (likely already applied): {e}")
+            conn.commit()
 
 # Global database manager instance
 db = DatabaseManager()
@@ -1,9 +1,14 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
+from contextlib import asynccontextmanager
+from langchain_core.tracers.langchain import wait_for_all_tracers
 import os
 from dotenv import load_dotenv
+import asyncio
+import json
 import logging
 
 # Load environment variables
@@ -15,10 +20,28 @@ from research_workflow import run_research_workflow
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Environment-derived settings are fixed for the process lifetime, so read them once at import
+CONFIG = {
+    "default_num_interviews": int(os.getenv("DEFAULT_NUM_INTERVIEWS", 10)),
+    "default_num_questions": int(os.getenv("DEFAULT_NUM_QUESTIONS", 5)),
+    "backend_host": os.getenv("BACKEND_HOST", "localhost"),
+    "backend_port": int(os.getenv("BACKEND_PORT", 8000))
+}
+CEREBRAS_API_CONFIGURED = bool(os.getenv("CEREBRAS_API_KEY"))
+LANGSMITH_CONFIGURED = bool(os.getenv("LANGSMITH_TRACING"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Traces upload in background batches; flush whatever is still queued before the process exits
+    wait_for_all_tracers()
+
 app = FastAPI(
     title="Automated Research API",
     description="AI-powered user research system with multi-agent workflow",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -28,15 +51,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 class ResearchRequest(BaseModel):
+    # Not extra="forbid": the frontend also sends fields this endpoint ignores (e.g. num_personas)
+    model_config = ConfigDict(frozen=True)
+
     research_question: str
     target_demographic: str
     num_interviews: Optional[int] = 10
     num_questions: Optional[int] = 5
 
 class ResearchResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     success: bool
     data: Optional[dict] = None
     error: Optional[str] = None
@@ -51,8 +80,51 @@ async def health_check():
     """Detailed health check"""
     return {
         "status": "healthy",
-        "cerebras_api_configured": bool(os.getenv("CEREBRAS_API_KEY")),
-        "langsmith_configured": bool(os.getenv("LANGSMITH_TRACING"))
+        "cerebras_api_configured": CEREBRAS_API_CONFIGURED,
+        "langsmith_configured": LANGSMITH_CONFIGURED
+    }
+
+def validate_research_request(request: ResearchRequest):
+    """Reject research requests with empty inputs"""
+    if not request.research_question.strip():
+        raise HTTPException(status_code=400, detail="Research question cannot be empty")
+    
+    if not request.target_demographic.strip():
+        raise HTTPException(status_code=400, detail="Target demographic cannot be empty")
+
+def minimal_persona(persona) -> dict:
+    """Summary fields shared by the persona list and each interview entry"""
+    return {
+        "name": persona.name,
+        "age": persona.age,
+        "job": persona.job,
+        "traits": persona.traits
+    }
+
+def format_research_result(result: dict) -> dict:
+    """Convert the final workflow state into the API response payload"""
+    num_interviews = len(result["all_interviews"])
+    
+    # Format the response
+    return {
+        "research_question": result["research_question"],
+        "target_demographic": result["target_demographic"],
+        "num_interviews": num_interviews,
+        "interview_questions": result["interview_questions"],
+        "personas": [
+            {
+                **minimal_persona(persona),
+                "communication_style": persona.communication_style,
+                "background": persona.background
+            } for persona in result["personas"]
+        ],
+        "interviews": [
+            {
+                "persona": minimal_persona(interview["persona"]),
+                "responses": interview["responses"]
+            } for interview in result["all_interviews"]
+        ],
+        "synthesis": result["synthesis"]
     }
 
 @app.post("/research", response_model=ResearchResponse)
@@ -61,18 +133,16 @@ async def conduct_research(request: ResearchRequest):
     Conduct automated user research using AI-powered multi-agent workflow
     """
     try:
-        logger.info(f"Starting research for question: {request.research_question}")
-        logger.info(f"Target demographic: {request.target_demographic}")
+        logger.info(
+            "Starting research for question: %s (target demographic: %s)",
+            request.research_question, request.target_demographic
+        )
         
         # Validate inputs
-        if not request.research_question.strip():
-            raise HTTPException(status_code=400, detail="Research question cannot be empty")
-        
-        if not request.target_demographic.strip():
-            raise HTTPException(status_code=400, detail="Target demographic cannot be empty")
+        validate_research_request(request)
         
         # Run the research workflow
-        result = run_research_workflow(
+        result = await run_research_workflow(
             research_question=request.research_question,
             target_demographic=request.target_demographic
         )
@@ -80,37 +150,10 @@ async def conduct_research(request: ResearchRequest):
         if result is None:
             raise HTTPException(status_code=500, detail="Research workflow failed")
         
-        # Format the response
-        formatted_result = {
-            "research_question": result["research_question"],
-            "target_demographic": result["target_demographic"],
-            "num_interviews": len(result["all_interviews"]),
-            "interview_questions": result["interview_questions"],
-            "personas": [
-                {
-                    "name": persona.name,
-                    "age": persona.age,
-                    "job": persona.job,
-                    "traits": persona.traits,
-                    "communication_style": persona.communication_style,
-                    "background": persona.background
-                } for persona in result["personas"]
-            ],
-            "interviews": [
-                {
-                    "persona": {
-                        "name": interview["persona"].name,
-                        "age": interview["persona"].age,
-                        "job": interview["persona"].job,
-                        "traits": interview["persona"].traits
-                    },
-                    "responses": interview["responses"]
-                } for interview in result["all_interviews"]
-            ],
-            "synthesis": result["synthesis"]
-        }
+        formatted_result = format_research_result(result)
+        num_interviews = formatted_result["num_interviews"]
         
-        logger.info(f"Research completed successfully with {len(result['all_interviews'])} interviews")
+        logger.info("Research completed successfully with %d interviews", num_interviews)
         
         return ResearchResponse(
             success=True,
@@ -126,26 +169,72 @@ async def conduct_research(request: ResearchRequest):
             error=f"Internal server error: {str(e)}"
         )
 
+@app.post("/research/stream")
+async def stream_research(request: ResearchRequest):
+    """
+    Conduct research and stream the synthesis as Server-Sent Events.
+    Emits a `progress` event as each interview completes, `token` events while the synthesis
+    is generated, then a single `result` or `error` event.
+    """
+    validate_research_request(request)
+    logger.info("Starting streamed research for question: %s", request.research_question)
+    
+    events: asyncio.Queue = asyncio.Queue()
+    
+    async def run():
+        try:
+            result = await run_research_workflow(
+                research_question=request.research_question,
+                target_demographic=request.target_demographic,
+                on_synthesis_token=lambda token: events.put_nowait(("token", token)),
+                on_interview_progress=lambda progress: events.put_nowait(("progress", progress))
+            )
+            events.put_nowait(("result", format_research_result(result)))
+        except Exception as e:
+            logger.error(f"Error during streamed research: {str(e)}")
+            events.put_nowait(("error", f"Internal server error: {str(e)}"))
+    
+    async def event_stream():
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                event, data = await events.get()
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+                if event in ("result", "error"):
+                    break
+        finally:
+            # Stop the workflow if the client disconnects early
+            task.cancel()
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.get("/config")
 async def get_config():
     """Get current configuration"""
-    return {
-        "default_num_interviews": int(os.getenv("DEFAULT_NUM_INTERVIEWS", 10)),
-        "default_num_questions": int(os.getenv("DEFAULT_NUM_QUESTIONS", 5)),
-        "backend_host": os.getenv("BACKEND_HOST", "localhost"),
-        "backend_port": int(os.getenv("BACKEND_PORT", 8000))
-    }
+    return CONFIG
 
 if __name__ == "__main__":
     import uvicorn
     
-    host = os.getenv("BACKEND_HOST", "localhost")
-    port = int(os.getenv("BACKEND_PORT", 8000))
+    host = CONFIG["backend_host"]
+    port = CONFIG["backend_port"]
     
-    uvicorn.run(
-        "main:app",
-        host=host,
-        port=port,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    if os.getenv("ENV") == "prod":
+        # Multiple worker processes on uvloop/httptools (requires uvicorn[standard])
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            workers=int(os.getenv("WORKERS", os.cpu_count() or 1)),
+            loop="uvloop",
+            http="httptools",
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            reload=True,
+            log_level="info"
+        )
\ No newline at end of file
@@ -1,18 +1,29 @@
 from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel
+from typing import Optional, Dict
 import os
 from dotenv import load_dotenv
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import json
+import orjson
 import random
 from datetime import datetime
+from functools import lru_cache
+from contextlib import asynccontextmanager
 from langsmith import Client, traceable
+from langchain_core.tracers.langchain import wait_for_all_tracers
 from database import get_db_connection, init_database
+from psycopg2.extras import execute_values
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()  # This will look for .env in the current directory
@@ -23,16 +34,21 @@ logger = logging.getLogger(__name__)
 
 # Initialize LangSmith with proper configuration
 os.environ["LANGCHAIN_TRACING_V2"] = os.getenv("LANGCHAIN_TRACING_V2", "true")
-os.environ["LANGCHAIN_PROJECT"] = os.getenv("LANGCHAIN_PROJECT", "automated-research-app")
+LANGCHAIN_TRACING_ENABLED = os.environ["LANGCHAIN_TRACING_V2"].lower() == "true"
+LANGCHAIN_PROJECT = os.environ["LANGCHAIN_PROJECT"] = os.getenv("LANGCHAIN_PROJECT", "automated-research-app")
 os.environ["LANGCHAIN_ENDPOINT"] = os.getenv("LANGCHAIN_ENDPOINT", "https://api.smith.langchain.com")
 
 # Try both LANGSMITH_API_KEY and LANGCHAIN_API_KEY for compatibility
 langsmith_api_key = os.getenv("LANGSMITH_API_KEY") or os.getenv("LANGCHAIN_API_KEY")
-if langsmith_api_key and langsmith_api_key != "your_langsmith_api_key_here":
+if not LANGCHAIN_TRACING_ENABLED:
+    # Skip client setup entirely when tracing is switched off
+    langsmith_client = None
+    logger.info("LangSmith tracing disabled via LANGCHAIN_TRACING_V2.")
+elif langsmith_api_key and langsmith_api_key != "your_langsmith_api_key_here":
     os.environ["LANGCHAIN_API_KEY"] = langsmith_api_key
     try:
         langsmith_client = Client()
-        logger.info(f"LangSmith integration enabled with project: {os.environ['LANGCHAIN_PROJECT']}")
+        logger.info(f"LangSmith integration enabled with project: {LANGCHAIN_PROJECT}")
         logger.info(f"LangSmith API Key configured: {langsmith_api_key[:20]}...")
     except Exception as e:
         langsmith_client = None
@@ -41,13 +57,58 @@ else:
     langsmith_client = None
     logger.warning("LangSmith API key not found or is placeholder. Tracing disabled.")
 
-# Initialize database using the new database manager
-init_database()
+# Read once at import; per-request code uses these instead of hitting os.environ
+CEREBRAS_API_KEY = os.getenv("CEREBRAS_API_KEY")
+CEREBRAS_API_CONFIGURED = bool(CEREBRAS_API_KEY)
+CLERK_PUBLISHABLE_KEY = os.getenv("CLERK_PUBLISHABLE_KEY", "pk_test_bW92aW5nLXJhY2Nvb24tNzEuY2xlcmsuYWNjb3VudHMuZGV2JA")
+
+# Upper bound on concurrent Cerebras calls; sizes both the HTTP pool and the worker pool below
+CEREBRAS_MAX_CONCURRENCY = int(os.getenv("CEREBRAS_MAX_CONCURRENCY", 32))
+
+# Shared HTTP session so Cerebras/Clerk calls reuse keep-alive connections instead of a new TLS handshake each time
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=CEREBRAS_MAX_CONCURRENCY,
+    # Retry connect errors and transient gateway statuses with short backoff on the same pool.
+    # Read timeouts are not retried (the Cerebras POST isn't idempotent), Retry-After is ignored, and
+    # 429 is left out because an immediate retry would just be rate-limited again; in each case a slow
+    # or throttled upstream falls back to the mock response instead of holding a worker thread.
+    max_retries=Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.25,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=False
+    )
+))
+
+# Static parts of every Cerebras request, built once rather than per call
+CEREBRAS_CHAT_URL = "https://api.cerebras.ai/v1/chat/completions"
+CEREBRAS_HEADERS = {
+    "Authorization": f"Bearer {CEREBRAS_API_KEY}",
+    "Content-Type": "application/json"
+}
+CEREBRAS_SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful assistant. Provide direct, clear responses."}
+
+# Prompt fragments that mark a generated line as echoed instructions rather than a question
+QUESTION_PROMPT_ARTIFACTS = ("Requirements:", "Generate", "Format:", "Topic:", "Target Audience:")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Initialize database on server startup rather than at import, so importing this module does no I/O
+    init_database()
+    yield
+    # Traces upload in background batches; flush whatever is still queued before the process exits
+    wait_for_all_tracers()
 
 app = FastAPI(
     title="Intelligent Research API",
     description="AI-powered user research system with intelligent persona generation",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Health check endpoint for Railway
@@ -70,6 +131,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 # Authentication setup
@@ -77,14 +139,14 @@ security = HTTPBearer()
 
 def get_clerk_public_key():
     """Get Clerk public key for JWT verification"""
-    clerk_publishable_key = os.getenv("CLERK_PUBLISHABLE_KEY", "pk_test_bW92aW5nLXJhY2Nvb24tNzEuY2xlcmsuYWNjb3VudHMuZGV2JA")
+    clerk_publishable_key = CLERK_PUBLISHABLE_KEY
     # Extract instance ID from publishable key
     instance_id = clerk_publishable_key.split("_")[2] if "_" in clerk_publishable_key else ""
     
     try:
         # Fetch JWKS from Clerk
         jwks_url = f"https://{instance_id}.clerk.accounts.dev/.well-known/jwks.json"
-        response = requests.get(jwks_url)
+        response = http_session.get(jwks_url)
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -166,53 +228,55 @@ class ResearchResponse(BaseModel):
 def ask_cerebras_ai(prompt: str) -> str:
     """Simulate Cerebras AI responses with intelligent patterns"""
     try:
-        # Import here to avoid startup delays
-        import requests
-        
-        api_key = os.getenv("CEREBRAS_API_KEY")
-        if not api_key:
+        if not CEREBRAS_API_KEY:
             # Fallback to intelligent mock responses
             return generate_intelligent_mock_response(prompt)
         
         # Try to use actual Cerebras API
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "model": "llama3.3-70b",
             "messages": [
-                {"role": "system", "content": "You are a helpful assistant. Provide direct, clear responses."},
+                CEREBRAS_SYSTEM_MESSAGE,
                 {"role": "user", "content": prompt}
             ],
             "temperature": 0.7,
             "max_tokens": 800
         }
         
-        response = requests.post(
-            "https://api.cerebras.ai/v1/chat/completions", 
-            headers=headers, 
-            json=payload,
+        response = http_session.post(
+            CEREBRAS_CHAT_URL, 
+            headers=CEREBRAS_HEADERS, 
+            data=orjson.dumps(payload),
             timeout=10  # Reduced from 30 to 10 seconds
         )
         
         if response.status_code == 200:
-            result = response.json()["choices"][0]["message"]["content"]
+            result = orjson.loads(response.content)["choices"][0]["message"]["content"]
             # Validate result is not empty or invalid
             if result and len(result.strip()) > 0:
                 return result.strip()
             else:
-                logger.warning("Cerebras API returned empty response")
+                logger.warning("Cerebras API returned empty response; falling back to mock response")
                 return generate_intelligent_mock_response(prompt)
         else:
-            logger.warning(f"Cerebras API error: {response.status_code}")
+            logger.warning(f"Cerebras API error: {response.status_code}; falling back to mock response")
             return generate_intelligent_mock_response(prompt)
             
     except Exception as e:
-        logger.warning(f"Failed to connect to Cerebras: {e}")
+        logger.warning(f"Failed to connect to Cerebras: {e}; falling back to mock response")
         return generate_intelligent_mock_response(prompt)
 
+# Dedicated worker pool for blocking Cerebras calls, so a large interview fan-out queues here
+# instead of filling the event loop's default executor used by database writes
+cerebras_executor = ThreadPoolExecutor(max_workers=CEREBRAS_MAX_CONCURRENCY, thread_name_prefix="cerebras")
+
+async def ask_cerebras_ai_async(prompt: str) -> str:
+    """Run ask_cerebras_ai on the bounded Cerebras worker pool without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    # Carry the current context over so @traceable runs nest under the calling request
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(cerebras_executor, context.run, ask_cerebras_ai, prompt)
+
 def generate_intelligent_mock_response(prompt: str) -> str:
     """Generate contextually intelligent mock responses"""
     prompt_lower = prompt.lower()
@@ -268,13 +332,9 @@ def store_research_session(session_id: str, request: 'ResearchRequest', result:
                 user_id
             ))
             
-            # Store personas
-            for persona in result.get('personas', []):
-                cursor.execute('''
-                    INSERT INTO personas 
-                    (session_id, name, age, job, traits, background, communication_style)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ''', (
+            # Store personas (single multi-row INSERT instead of one round-trip per persona)
+            persona_rows = (
+                (
                     session_id,
                     persona['name'],
                     persona['age'],
@@ -282,23 +342,32 @@ def store_research_session(session_id: str, request: 'ResearchRequest', result:
                     json.dumps(persona['traits']),
                     persona['background'],
                     persona['communication_style']
-                ))
+                )
+                for persona in result.get('personas', [])
+            )
+            execute_values(cursor, '''
+                INSERT INTO personas 
+                (session_id, name, age, job, traits, background, communication_style)
+                VALUES %s
+            ''', persona_rows, page_size=500)
             
             # Store interviews
-            for interview in result.get('interviews', []):
-                persona_name = interview['persona']['name']
-                for i, response in enumerate(interview['responses']):
-                    cursor.execute('''
-                        INSERT INTO interviews 
-                        (session_id, persona_name, question, answer, question_order)
-                        VALUES (%s, %s, %s, %s, %s)
-                    ''', (
-                        session_id,
-                        persona_name,
-                        response['question'],
-                        response['answer'],
-                        i + 1
-                    ))
+            interview_rows = (
+                (
+                    session_id,
+                    interview['persona']['name'],
+                    response['question'],
+                    response['answer'],
+                    i + 1
+                )
+                for interview in result.get('interviews', [])
+                for i, response in enumerate(interview['responses'])
+            )
+            execute_values(cursor, '''
+                INSERT INTO interviews 
+                (session_id, persona_name, question, answer, question_order)
+                VALUES %s
+            ''', interview_rows, page_size=500)
             
             conn.commit()
             logger.info(f"Stored research session {session_id} in database")
@@ -342,8 +411,12 @@ def extract_demographic(prompt: str) -> str:
 @traceable(name="generate_questions")
 def generate_clean_questions(research_question: str, demographic: str, num_questions: int) -> list:
     """Generate clean, properly formatted interview questions"""
+    return list(_clean_question_templates(research_question)[:num_questions])
+
+@lru_cache(maxsize=512)
+def _clean_question_templates(research_question: str) -> tuple:
+    """Build the question templates for a topic (memoized, so the result is shared and immutable)"""
     topic_lower = research_question.lower()
-    demographic_lower = demographic.lower()
     
     if "debug" in topic_lower or "production" in topic_lower:
         questions = [
@@ -371,14 +444,14 @@ def generate_clean_questions(research_question: str, demographic: str, num_quest
         ]
     else:
         questions = [
-            f"How do you currently approach {research_question.lower()} in your work?",
-            f"What are the main challenges you face with {research_question.lower()}?",
+            f"How do you currently approach {topic_lower} in your work?",
+            f"What are the main challenges you face with {topic_lower}?",
             f"What tools or methods have you found most effective?",
             f"How would you improve the current process?",
             f"What advice would you give to someone new to this area?"
         ]
     
-    return questions[:num_questions]
+    return tuple(questions)
 
 def generate_smart_questions(topic: str) -> str:
     """Generate contextually relevant interview questions"""
@@ -410,9 +483,11 @@ def generate_smart_questions(topic: str) -> str:
     return "\n".join(base_questions[:5])
 
 @traceable(name="generate_personas")
+@lru_cache(maxsize=512)
 def generate_smart_personas(demographic: str) -> str:
     """Generate demographic-appropriate personas - minimal format"""
     demographic_lower = demographic.lower()
+    demographic_title = demographic.title()
     
     # Generate simple personas based on demographic
     if "farmer" in demographic_lower:
@@ -561,7 +636,7 @@ def generate_smart_personas(demographic: str) -> str:
             {
                 "name": "Jamie Rodriguez",
                 "age": 32,
-                "job": f"{demographic.title()} Specialist",
+                "job": f"{demographic_title} Specialist",
                 "traits": ["experienced", "methodical"],
                 "communication_style": "professional",
                 "background": f"8 years {demographic}"
@@ -569,7 +644,7 @@ def generate_smart_personas(demographic: str) -> str:
             {
                 "name": "Sam Thompson",
                 "age": 29,
-                "job": f"Senior {demographic.title()}",
+                "job": f"Senior {demographic_title}",
                 "traits": ["analytical", "innovative"],
                 "communication_style": "data-driven",
                 "background": f"6 years experience"
@@ -577,7 +652,7 @@ def generate_smart_personas(demographic: str) -> str:
             {
                 "name": "Avery Brown",
                 "age": 36,
-                "job": f"{demographic.title()} Consultant",
+                "job": f"{demographic_title} Consultant",
                 "traits": ["strategic", "solution-oriented"],
                 "communication_style": "consultative",
                 "background": f"10+ years consulting"
@@ -685,23 +760,24 @@ def generate_contextual_interview_response(prompt: str) -> str:
     """Generate contextual interview responses based on persona and question"""
     # Extract persona info and question from prompt
     lines = prompt.split('\n')
+    prompt_lower = prompt.lower()
     
     # Determine response style based on persona
-    if "engineer" in prompt.lower() or "developer" in prompt.lower():
+    if "engineer" in prompt_lower or "developer" in prompt_lower:
         responses = [
             "From my technical experience, this requires careful architecture planning. We usually start with scalability considerations and work our way through performance optimization.",
             "The biggest challenge I've faced is balancing code quality with delivery speed. Our team has found success using automated testing and CI/CD pipelines.",
             "We've implemented solutions using microservices, which works well for our distributed team. The key is having clear API contracts and proper monitoring.",
             "The tools we use include industry standards like Docker and Kubernetes, but we often need custom solutions for specific requirements."
         ]
-    elif "manager" in prompt.lower() or "product" in prompt.lower():
+    elif "manager" in prompt_lower or "product" in prompt_lower:
         responses = [
             "From a business perspective, this needs to align with our strategic goals. We typically start by validating user needs before technical implementation.",
             "Our approach involves understanding market requirements first, then working with engineering to find the best solution within budget and timeline constraints.",
             "The main challenge is balancing stakeholder expectations with technical realities. Clear communication and regular check-ins help manage this effectively.",
             "We prioritize features based on user impact and business value. Our roadmap focuses on delivering incremental value while building toward bigger goals."
         ]
-    elif "chip" in prompt.lower() or "hardware" in prompt.lower():
+    elif "chip" in prompt_lower or "hardware" in prompt_lower:
         responses = [
             "In hardware design, power efficiency is critical. We spend significant time optimizing for thermal constraints while maintaining performance targets.",
             "Our design process involves extensive simulation before any physical prototyping. This helps catch issues early and reduces development costs.",
@@ -724,16 +800,17 @@ def generate_smart_synthesis(prompt: str) -> str:
     # Extract research question and demographic if possible
     research_question = "the research topic"
     demographic = "the target demographic"
+    prompt_lower = prompt.lower()
     
     # Look for context in the prompt
-    if "research question:" in prompt.lower():
+    if "research question:" in prompt_lower:
         lines = prompt.split('\n')
         for line in lines:
             if "research question:" in line.lower():
                 research_question = line.split(':', 1)[1].strip()
                 break
     
-    if "demographic:" in prompt.lower():
+    if "demographic:" in prompt_lower:
         lines = prompt.split('\n')
         for line in lines:
             if "demographic:" in line.lower():
@@ -907,17 +984,19 @@ def generate_contextual_synthesis(research_question: str, demographic: str, inte
         })
         
         for qa in interview['responses']:
-            all_responses.append(qa['answer'])
+            all_responses.append(qa['answer'].lower())
+    
+    rq_lower = research_question.lower()
     
     # Analyze common themes
     common_themes = []
-    if any("challenge" in resp.lower() for resp in all_responses):
+    if any("challenge" in resp for resp in all_responses):
         common_themes.append("Implementation Challenges")
-    if any("ai" in resp.lower() and ("tool" in resp.lower() or "workflow" in resp.lower()) for resp in all_responses):
+    if any("ai" in resp and ("tool" in resp or "workflow" in resp) for resp in all_responses):
         common_themes.append("AI Tool Integration")
-    if any("productivity" in resp.lower() or "efficiency" in resp.lower() for resp in all_responses):
+    if any("productivity" in resp or "efficiency" in resp for resp in all_responses):
         common_themes.append("Productivity Impact")
-    if any("quality" in resp.lower() or "standard" in resp.lower() for resp in all_responses):
+    if any("quality" in resp or "standard" in resp for resp in all_responses):
         common_themes.append("Quality Concerns")
     
     # Generate insights
@@ -925,16 +1004,16 @@ def generate_contextual_synthesis(research_question: str, demographic: str, inte
     opportunities = []
     
     for resp in all_responses:
-        if any(word in resp.lower() for word in ["struggle", "difficult", "challenge", "problem"]):
+        if any(word in resp for word in ["struggle", "difficult", "challenge", "problem"]):
             pain_points.append("User adoption and learning curve challenges")
-        if any(word in resp.lower() for word in ["improve", "better", "enhance", "optimize"]):
+        if any(word in resp for word in ["improve", "better", "enhance", "optimize"]):
             opportunities.append("Process optimization potential")
     
     synthesis = f"""# RESEARCH ANALYSIS: {research_question.title()}
 
 ## EXECUTIVE SUMMARY
 
-This research examined {research_question.lower()} among {demographic}, conducting {len(interviews)} in-depth interviews to understand current practices, challenges, and opportunities. The analysis reveals significant insights about user behavior, pain points, and strategic opportunities for improvement.
+This research examined {rq_lower} among {demographic}, conducting {len(interviews)} in-depth interviews to understand current practices, challenges, and opportunities. The analysis reveals significant insights about user behavior, pain points, and strategic opportunities for improvement.
 
 ## KEY FINDINGS
 
@@ -974,7 +1053,7 @@ Users demonstrate varying levels of adoption and integration, with experienced p
 
 ## CONCLUSION
 
-The research demonstrates significant potential for {research_question.lower()} advancement within the {demographic} community. Success will depend on addressing identified pain points while leveraging the enthusiasm and expertise of early adopters to drive broader adoption.
+The research demonstrates significant potential for {rq_lower} advancement within the {demographic} community. Success will depend on addressing identified pain points while leveraging the enthusiasm and expertise of early adopters to drive broader adoption.
 
 **Next Steps**: Implement immediate recommendations, establish success metrics, and plan follow-up research to measure impact and identify emerging needs."""
 
@@ -990,7 +1069,7 @@ async def health_check():
     """Detailed health check"""
     return {
         "status": "healthy",
-        "cerebras_api_configured": bool(os.getenv("CEREBRAS_API_KEY")),
+        "cerebras_api_configured": CEREBRAS_API_CONFIGURED,
         "langsmith_configured": bool(langsmith_client),
         "intelligent_mode": True
     }
@@ -1009,55 +1088,39 @@ async def get_dashboard_stats(current_user: Optional[Dict] = Depends(get_current
                 user_filter = " WHERE user_id = %s"
                 params = [current_user.get("user_id")]
         
-            # Get total research sessions
-            query = f"SELECT COUNT(*) as count FROM research_sessions{user_filter}"
-            cursor.execute(query, params)
-            result = cursor.fetchone()
-            total_sessions = result["count"] if result else 0
-        
-            # Get total personas generated (filtered by user)
-            persona_query = f"SELECT COUNT(*) as count FROM personas p JOIN research_sessions rs ON p.session_id = rs.session_id{user_filter}"
-            cursor.execute(persona_query, params)
-            result = cursor.fetchone()
-            total_personas = result["count"] if result else 0
-            
-            # Get total interviews conducted (filtered by user)
-            interview_query = f"SELECT COUNT(*) as count FROM interviews i JOIN research_sessions rs ON i.session_id = rs.session_id{user_filter}"
-            cursor.execute(interview_query, params)
-            result = cursor.fetchone()
-            total_interviews = result["count"] if result else 0
+            # Compute every count in a single round-trip: one scan of the user's sessions
+            # with FILTER aggregates, plus persona/interview counts joined to the same CTE
+            stats_query = f"""WITH sessions AS (
+                    SELECT session_id, status, created_at
+                    FROM research_sessions{user_filter}
+                )
+                SELECT
+                    COUNT(*) as total_sessions,
+                    COUNT(*) FILTER (WHERE status = 'completed') as completed_sessions,
+                    COUNT(*) FILTER (WHERE status = 'failed') as failed_sessions,
+                    COUNT(*) FILTER (WHERE status = 'running') as running_sessions,
+                    COUNT(*) FILTER (WHERE created_at::date = CURRENT_DATE) as sessions_today,
+                    COUNT(*) FILTER (WHERE created_at >= date_trunc('week', CURRENT_DATE)) as sessions_this_week,
+                    (SELECT COUNT(*) FROM personas p JOIN sessions s ON p.session_id = s.session_id) as total_personas,
+                    (SELECT COUNT(*) FROM interviews i JOIN sessions s ON i.session_id = s.session_id) as total_interviews
+                FROM sessions"""
+            cursor.execute(stats_query, params)
+            stats = cursor.fetchone() or {}
             
-            # Get sessions by status (filtered by user)
-            status_query = f"""SELECT status, COUNT(*) as count
-                FROM research_sessions{user_filter}
-                GROUP BY status"""
-            cursor.execute(status_query, params)
-            status_rows = cursor.fetchall()
-            status_counts = {row["status"]: row["count"] for row in status_rows} if status_rows else {}
+            total_sessions = stats.get("total_sessions", 0)
+            total_personas = stats.get("total_personas", 0)
+            total_interviews = stats.get("total_interviews", 0)
             
             # Calculate status metrics
-            completed_sessions = status_counts.get('completed', 0)
-            failed_sessions = status_counts.get('failed', 0)
-            running_sessions = status_counts.get('running', 0)
+            completed_sessions = stats.get("completed_sessions", 0)
+            failed_sessions = stats.get("failed_sessions", 0)
+            running_sessions = stats.get("running_sessions", 0)
             
             # Get average completion time for completed sessions - using default since no updated_at field
             avg_completion_time = 0  # Cannot calculate without updated_at field in database
             
-            # Get sessions created today (filtered by user)
-            today_query = f"""SELECT COUNT(*) as count
-                FROM research_sessions 
-                WHERE created_at::date = CURRENT_DATE{user_filter.replace(' WHERE', ' AND') if user_filter else ''}"""
-            cursor.execute(today_query, params)
-            result = cursor.fetchone()
-            sessions_today = result["count"] if result else 0
-            
-            # Get sessions created this week (filtered by user)
-            week_query = f"""SELECT COUNT(*) as count
-                FROM research_sessions 
-                WHERE created_at >= date_trunc('week', CURRENT_DATE){user_filter.replace(' WHERE', ' AND') if user_filter else ''}"""
-            cursor.execute(week_query, params)
-            result = cursor.fetchone()
-            sessions_this_week = result["count"] if result else 0
+            sessions_today = stats.get("sessions_today", 0)
+            sessions_this_week = stats.get("sessions_this_week", 0)
             
             # Get recent sessions with enhanced data (filtered by user)
             recent_query = f"""SELECT session_id, research_question, target_demographic, created_at, status, 
@@ -1582,9 +1645,10 @@ async def conduct_research(request: ResearchRequest, current_user: Optional[Dict
                 "session_type": "guest"
             }
         
-        logger.info(f"Starting intelligent research for: {request.research_question}")
-        logger.info(f"Target demographic: {request.target_demographic}")
-        logger.info(f"Session ID: {session_id}")
+        logger.info(
+            "Starting intelligent research for: %s (target demographic: %s, session ID: %s)",
+            request.research_question, request.target_demographic, session_id
+        )
         
         # Initialize research session
         
@@ -1594,7 +1658,7 @@ async def conduct_research(request: ResearchRequest, current_user: Optional[Dict
                 "session_id": session_id,
                 "research_question": request.research_question,
                 "target_demographic": request.target_demographic,
-                "project": os.environ.get("LANGCHAIN_PROJECT", "automated-research-app")
+                "project": LANGCHAIN_PROJECT
             }
         
         # Validate inputs
@@ -1624,7 +1688,7 @@ Target Audience: {request.target_demographic}
 Format: Provide each question on a separate line, numbered.
 Make each question comprehensive and specific to generate rich, detailed responses."""
         
-        questions_response = ask_cerebras_ai(question_prompt)
+        questions_response = await ask_cerebras_ai_async(question_prompt)
         logger.info(f"Questions generated: {len(questions_response)} characters")
         
         # Parse and validate questions
@@ -1634,7 +1698,7 @@ Make each question comprehensive and specific to generate rich, detailed respons
         valid_questions = []
         for q in raw_questions:
             # Skip questions that contain prompt artifacts or are too long
-            if (not any(artifact in q for artifact in ["Requirements:", "Generate", "Format:", "Topic:", "Target Audience:"]) 
+            if (not any(artifact in q for artifact in QUESTION_PROMPT_ARTIFACTS) 
                 and len(q) < 200 and q.endswith('?')):
                 valid_questions.append(q)
         
@@ -1661,7 +1725,7 @@ For each persona, provide:
 
 Respond in JSON format with a "personas" array."""
         
-        personas_response = ask_cerebras_ai(persona_prompt)
+        personas_response = await ask_cerebras_ai_async(persona_prompt)
         try:
             # Validate that response looks like JSON before parsing
             if personas_response.startswith('{') and personas_response.endswith('}'):
@@ -1686,27 +1750,35 @@ Respond in JSON format with a "personas" array."""
         # Step 3: Conduct intelligent interviews
         logger.info(f"Step 3: Conducting {len(personas)} interviews with {len(questions)} questions each...")
         
-        interviews = []
-        for i, persona in enumerate(personas[:request.num_interviews]):
-            logger.info(f"Interviewing persona {i+1}/{len(personas[:request.num_interviews])}: {persona['name']}")
-            interview_responses = []
-            
-            # Process interview for persona
-            
-            for question in questions:
-                # Generate contextual response based on persona
-                interview_prompt = f"""You are {persona['name']}, a {persona['age']}-year-old {persona['job']} who is {', '.join(persona['traits'])}.
+        interview_personas = personas[:request.num_interviews]
+        interview_prompts = []
+        for persona in interview_personas:
+            # Persona context is identical for every question, so build it once per persona
+            persona_preamble = f"""You are {persona['name']}, a {persona['age']}-year-old {persona['job']} who is {', '.join(persona['traits'])}.
 
 Your communication style is {persona['communication_style']}.
 Background: {persona['background']}
 
 Answer this question in 2-3 sentences as {persona['name']} in your authentic voice. DO NOT use JSON format. DO NOT include any code or markup. Just provide a natural, conversational response as if speaking directly to an interviewer:
 
-Question: {question}
+Question: """
+            
+            for question in questions:
+                # Generate contextual response based on persona
+                interview_prompts.append(f"""{persona_preamble}{question}
 
-Be realistic and specific to your role and experience. Give honest, thoughtful answers as a real person would."""
-                
-                answer = ask_cerebras_ai(interview_prompt)
+Be realistic and specific to your role and experience. Give honest, thoughtful answers as a real person would.""")
+        
+        # Run persona/question calls concurrently on the bounded Cerebras pool instead of blocking the event loop serially
+        answers = iter(await asyncio.gather(*(ask_cerebras_ai_async(prompt) for prompt in interview_prompts)))
+        
+        interviews = []
+        for i, persona in enumerate(interview_personas):
+            logger.info("Interviewed persona %d/%d: %s", i + 1, len(interview_personas), persona['name'])
+            interview_responses = []
+            
+            for question in questions:
+                answer = next(answers)
                 
                 # If we get a corrupted JSON response, generic response, or response that doesn't match the question, generate a clean response
                 if (answer.strip().startswith('{') or 
@@ -1715,6 +1787,7 @@ Be realistic and specific to your role and experience. Give honest, thoughtful a
                     "biggest challenge I've faced" in answer or
                     "microservices" in answer or
                     "CI/CD pipelines" in answer):
+                    logger.warning("Unusable interview answer for %s; falling back to generated response", persona['name'])
                     answer = generate_clean_interview_response(persona, question)
                 
                 interview_responses.append({
@@ -1751,7 +1824,7 @@ Number of Interviews: {len(interviews)}
         
         # Step 4: Data Analysis and Synthesis
         
-        synthesis = ask_cerebras_ai(synthesis_prompt)
+        synthesis = await ask_cerebras_ai_async(synthesis_prompt)
         
         # Validate synthesis quality - if it's generic or invalid, generate better analysis
         if not synthesis or len(synthesis.strip()) < 200 or "I understand your request" in synthesis:
@@ -1804,12 +1877,12 @@ Number of Interviews: {len(interviews)}
         }
         
         
-        logger.info(f"Research completed successfully with {len(interviews)} interviews")
+        logger.info("Research completed successfully with %d interviews", result["num_interviews"])
         
         # Step 6: Data Storage
         
         # Store research session in database
-        store_research_session(session_id, request, result, user_context)
+        await asyncio.to_thread(store_research_session, session_id, request, result, user_context)
         
         
         # Add session metadata
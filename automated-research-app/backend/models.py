@@ -1,20 +1,20 @@
-from typing import Dict, List, TypedDict
-from pydantic import BaseModel, Field
-import logging
+from dataclasses import dataclass, field
+from typing import Dict, List
+from pydantic import BaseModel, ConfigDict, Field
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-from langchain_cerebras import ChatCerebras
-from langgraph.graph import StateGraph, END
-
 # Configuration Constants
 DEFAULT_NUM_INTERVIEWS = int(os.getenv("DEFAULT_NUM_INTERVIEWS", 10))
 DEFAULT_NUM_QUESTIONS = int(os.getenv("DEFAULT_NUM_QUESTIONS", 5))
 
 class Persona(BaseModel):
+    # Not extra="forbid": these models are filled by the LLM, which may add stray keys we simply ignore
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Full name of the persona")
     age: int = Field(..., description="Age in years")
     job: str = Field(..., description="Job title or role")
@@ -23,27 +23,32 @@ class Persona(BaseModel):
     background: str = Field(..., description="One background detail shaping their perspective")
 
 class PersonasList(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     personas: List[Persona] = Field(..., description="List of generated personas")
 
 class Questions(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     questions: List[str] = Field(..., description="List of interview questions")
 
-class InterviewState(TypedDict):
+class PersonaAnswers(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    answers: List[str] = Field(..., description="One answer per interview question, in the order asked")
+
+@dataclass(slots=True)
+class InterviewState:
     # Configuration inputs
     research_question: str
     target_demographic: str
-    num_interviews: int
-    num_questions: int
+    num_interviews: int = DEFAULT_NUM_INTERVIEWS
+    num_questions: int = DEFAULT_NUM_QUESTIONS
 
     # Generated data
-    interview_questions: List[str]
-    personas: List[Persona]
-
-    # Current interview tracking
-    current_persona_index: int
-    current_question_index: int
-    current_interview_history: List[Dict]
+    interview_questions: List[str] = field(default_factory=list)
+    personas: List[Persona] = field(default_factory=list)
 
     # Results storage
-    all_interviews: List[Dict]
-    synthesis: str
\ No newline at end of file
+    all_interviews: List[Dict] = field(default_factory=list)
+    synthesis: str = ""
@@ -1,158 +1,296 @@
+import asyncio
+import json
 import os
-from typing import Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+import httpx
 from langchain_cerebras import ChatCerebras
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 from pydantic import ValidationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 import time
 
 from models import (
-    Persona, PersonasList, Questions, InterviewState,
+    Persona, PersonasList, PersonaAnswers, Questions, InterviewState,
     DEFAULT_NUM_INTERVIEWS, DEFAULT_NUM_QUESTIONS
 )
 
-# Initialize LLM
-llm = ChatCerebras(
-    model="llama3.3-70b",
-    temperature=0.7,
-    max_tokens=800
+# Cache LLM responses in-process so repeated prompts (reruns, demos) skip the API round-trip.
+# Bounded so a long-running server evicts old entries; set LLM_CACHE_MAXSIZE=0 to disable.
+LLM_CACHE_MAXSIZE = int(os.getenv("LLM_CACHE_MAXSIZE", 256))
+if LLM_CACHE_MAXSIZE > 0:
+    set_llm_cache(InMemoryCache(maxsize=LLM_CACHE_MAXSIZE))
+
+# Upper bound on concurrent LLM requests during the interview phase
+MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 32))
+
+# Shared HTTP connection pool so concurrent LLM calls reuse warm TLS connections
+_http_limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_http_timeout = httpx.Timeout(60.0, connect=5.0)
+
+# Token-bucket limiter shared by every LLM call (including abatch fan-out) to stay under provider RPM
+CEREBRAS_RPM = int(os.getenv("CEREBRAS_RPM", 500))
+rate_limiter = InMemoryRateLimiter(
+    requests_per_second=CEREBRAS_RPM / 60,
+    check_every_n_seconds=0.05,
+    max_bucket_size=MAX_CONCURRENCY
 )
 
+# Shared HTTP clients so both model tiers reuse the same warm connection pool
+_http_client = httpx.Client(limits=_http_limits, timeout=_http_timeout)
+_http_async_client = httpx.AsyncClient(limits=_http_limits, timeout=_http_timeout)
+
+def _make_llm(model: str, max_tokens: int) -> ChatCerebras:
+    """Create a Cerebras chat model sharing the rate limiter and HTTP pool"""
+    return ChatCerebras(
+        model=model,
+        temperature=0.7,
+        max_tokens=max_tokens,
+        max_retries=3,
+        # The SDK sends its own per-request timeout, which overrides the httpx client default
+        request_timeout=_http_timeout,
+        rate_limiter=rate_limiter,
+        http_client=_http_client,
+        http_async_client=_http_async_client
+    )
+
+# Small model for short structured tasks (questions, personas, interview answers);
+# large model reserved for the synthesis step
+SMALL_MODEL = "llama3.1-8b"
+LARGE_MODEL = "llama3.3-70b"
+
+# Output budgets per task; generated tokens dominate latency, so each call only gets what it needs.
+# Persona and interview budgets scale with the number of items requested and are sized per call.
+QUESTIONS_MAX_TOKENS = 512
+PERSONA_MAX_TOKENS = 120
+ANSWER_MAX_TOKENS = 160  # prompt asks for under 120; the rest is headroom for JSON quoting
+STRUCTURED_OUTPUT_OVERHEAD_TOKENS = 128
+SYNTHESIS_MAX_TOKENS = 2048
+
+questions_llm = _make_llm(SMALL_MODEL, QUESTIONS_MAX_TOKENS)
+synthesis_llm = _make_llm(LARGE_MODEL, SYNTHESIS_MAX_TOKENS)
+
 # General model instructions
 system_prompt = """You are a helpful assistant. Provide a direct, clear response without showing your thinking process. Respond directly without using <think> tags or showing internal reasoning."""
 
-def ask_ai(prompt: str) -> str:
-    """Send prompt to Cerebras AI and return response"""
-    response = llm.invoke([
+async def stream_synthesis(prompt: str) -> AsyncIterator[str]:
+    """Stream a response from Cerebras AI, yielding content as it arrives"""
+    async for chunk in synthesis_llm.astream([
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": prompt}
-    ])
-    return response.content
+    ]):
+        if chunk.content:
+            yield chunk.content
 
-def configuration_node(state: InterviewState) -> Dict:
-    """Get user inputs and generate interview questions"""
-    print(f"\n🔧 Configuring research: {state['research_question']}")
-    print(f"📊 Planning {DEFAULT_NUM_INTERVIEWS} interviews with {DEFAULT_NUM_QUESTIONS} questions each")
-
-    question_gen_prompt = f"""Generate exactly {DEFAULT_NUM_QUESTIONS} interview questions about: {state['research_question']}. Use the provided structured output to format the questions."""
+async def generate_questions(research_question: str) -> List[str]:
+    """Generate interview questions for the research topic"""
+    question_gen_prompt = f"""Generate exactly {DEFAULT_NUM_QUESTIONS} interview questions about: {research_question}. Use the provided structured output to format the questions."""
     
-    structured_llm = llm.with_structured_output(Questions)
-    questions = structured_llm.invoke(question_gen_prompt)
-    questions = questions.questions
-    print(f"✅ Generated {len(questions)} questions")
+    structured_llm = questions_llm.with_structured_output(Questions)
+    questions = await structured_llm.ainvoke(question_gen_prompt)
+    return questions.questions
+
+# Attempts and exponential backoff (seconds) shared by the persona and interview retry loops
+LLM_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_MIN = 1
+RETRY_BACKOFF_MAX = 8
+
+@retry(
+    stop=stop_after_attempt(LLM_MAX_ATTEMPTS),
+    wait=wait_exponential(multiplier=1, min=RETRY_BACKOFF_MIN, max=RETRY_BACKOFF_MAX),
+    retry=retry_if_exception_type((ValidationError, ValueError, TypeError)),
+    reraise=True
+)
+async def _generate_personas(structured_llm, messages: List[Dict], num_personas: int) -> List[Persona]:
+    """Generate and validate personas; on failure, feed the error back into messages before retrying"""
+    try:
+        raw_output = await structured_llm.ainvoke(messages)
+        if raw_output is None:
+            raise ValueError("LLM returned None")
 
-    return {
-        "num_questions": DEFAULT_NUM_QUESTIONS,
-        "num_interviews": DEFAULT_NUM_INTERVIEWS,
-        "interview_questions": questions
-    }
+        validated = PersonasList.model_validate(raw_output)
 
-def persona_generation_node(state: InterviewState) -> Dict:
-    """Generate diverse personas for interviews"""
-    num_personas = state['num_interviews']
-    demographic = state['target_demographic']
-    max_retries = 5
+        if len(validated.personas) != num_personas:
+            raise ValueError(f"Expected {num_personas} personas, got {len(validated.personas)}")
+
+        return validated.personas
 
-    print(f"\n👥 Creating {state['num_interviews']} personas...")
+    except (ValidationError, ValueError, TypeError) as e:
+        print(f"❌ Persona generation attempt failed: {e}")
+        # Retry with feedback so the model can correct itself
+        messages.append({
+            "role": "user",
+            "content": f"Your output had error: {e}. Fix and retry, returning exactly {num_personas} personas."
+        })
+        raise
 
+async def generate_personas(num_personas: int, demographic: str) -> List[Persona]:
+    """Generate diverse personas for interviews"""
     persona_prompt = (
         f"Generate exactly {num_personas} unique personas for an interview. "
         f"Each should belong to the target demographic: {demographic}. "
         "Respond only in JSON using this format: {{ personas: [ ... ] }}"
     )
 
-    structured_llm = llm.with_structured_output(PersonasList)
+    persona_llm = _make_llm(SMALL_MODEL, PERSONA_MAX_TOKENS * num_personas + STRUCTURED_OUTPUT_OVERHEAD_TOKENS)
+    structured_llm = persona_llm.with_structured_output(PersonasList)
+    messages = [{"role": "user", "content": persona_prompt}]
 
-    for attempt in range(max_retries):
-        try:
-            raw_output = structured_llm.invoke([{"role": "user", "content": persona_prompt}])
-            if raw_output is None:
-                raise ValueError("LLM returned None")
+    try:
+        return await _generate_personas(structured_llm, messages, num_personas)
+    except (ValidationError, ValueError, TypeError) as e:
+        raise RuntimeError(f"❗️Failed after {LLM_MAX_ATTEMPTS} attempts") from e
 
-            validated = PersonasList.model_validate(raw_output)
+async def setup_node(state: InterviewState) -> Dict:
+    """Generate interview questions and personas concurrently (they don't depend on each other)"""
+    print(f"\n🔧 Configuring research: {state.research_question}")
+    print(f"📊 Planning {DEFAULT_NUM_INTERVIEWS} interviews with {DEFAULT_NUM_QUESTIONS} questions each")
+    print(f"\n👥 Creating {state.num_interviews} personas...")
 
-            if len(validated.personas) != num_personas:
-                raise ValueError(f"Expected {num_personas} personas, got {len(validated.personas)}")
+    # Persona retries happen inside generate_personas, so only that branch is re-issued on failure
+    questions, personas = await asyncio.gather(
+        generate_questions(state.research_question),
+        generate_personas(state.num_interviews, state.target_demographic)
+    )
 
-            personas = validated.personas
-            for i, p in enumerate(personas):
-                print(f"Persona {i+1}: {p.name}")
+    print(f"✅ Generated {len(questions)} questions")
+    for i, p in enumerate(personas):
+        print(f"Persona {i+1}: {p.name}")
 
-            return {
-                "personas": personas,
-                "current_persona_index": 0,
-                "current_question_index": 0,
-                "all_interviews": []
-            }
+    return {
+        "num_questions": DEFAULT_NUM_QUESTIONS,
+        "num_interviews": DEFAULT_NUM_INTERVIEWS,
+        "interview_questions": questions,
+        "personas": personas,
+        "all_interviews": []
+    }
 
-        except (ValidationError, ValueError, TypeError) as e:
-            print(f"❌ Attempt {attempt+1} failed: {e}")
-            if attempt == max_retries - 1:
-                raise RuntimeError(f"❗️Failed after {max_retries} attempts")
+async def interviews_node(state: InterviewState, config: RunnableConfig) -> Dict:
+    """Conduct all persona interviews concurrently, one LLM call per persona"""
+    on_progress = config.get("configurable", {}).get("on_interview_progress")
+    personas = state.personas
+    questions = state.interview_questions
+    num_questions = len(questions)
 
-def interview_node(state: InterviewState) -> Dict:
-    """Conduct interview with current persona"""
-    persona = state['personas'][state['current_persona_index']]
-    question = state['interview_questions'][state['current_question_index']]
+    print(f"\n💬 Interviewing {len(personas)} personas with {num_questions} questions each...")
 
-    print(f"\n💬 Interview {state['current_persona_index'] + 1}/{len(state['personas'])} - {persona.name}")
-    print(f"Q{state['current_question_index'] + 1}: {question}")
+    question_list = "\n".join(f"{j}. {question}" for j, question in enumerate(questions, 1))
 
-    # Generate response as this persona with detailed character context
-    interview_prompt = f"""You are {persona.name}, a {persona.age}-year-old {persona.job} who is {persona.traits}.
-Answer the following question in 2-3 sentences:
+    # Shared by every persona, so build it once
+    interview_prompt = f"""Answer each of the following questions in 2-3 sentences (under 120 tokens per answer):
 
-Question: {question}
+{question_list}
 
-Answer as {persona.name} in your own authentic voice. Be brief but creative and unique, and make each answer conversational.
-BE REALISTIC – do not be overly optimistic. Mimic real human behavior based on your persona, and give honest answers."""
+Return exactly {num_questions} answers, one per question, in the same order."""
 
-    answer = ask_ai(interview_prompt)
-    print(f"A: {answer}")
-
-    # Update state with interview history
-    history = state.get('current_interview_history', []) + [{
-        "question": question,
-        "answer": answer
-    }]
-
-    # Check if this interview is complete
-    if state['current_question_index'] + 1 >= len(state['interview_questions']):
-        # Interview complete - save it and move to next persona
-        return {
-            "all_interviews": state['all_interviews'] + [{
-                'persona': persona,
-                'responses': history
-            }],
-            "current_interview_history": [],
-            "current_question_index": 0,
-            "current_persona_index": state['current_persona_index'] + 1
-        }
-
-    # Continue with next question for same persona
-    return {
-        "current_interview_history": history,
-        "current_question_index": state['current_question_index'] + 1
-    }
+    # All questions go into a single prompt per persona, and all personas are interviewed concurrently
+    conversations = []
+    for persona in personas:
+        # Persona card lives in the system message so it forms a stable prefix across retries
+        persona_card = f"""{system_prompt}
 
-def synthesis_node(state: InterviewState) -> Dict:
+You are {persona.name}, a {persona.age}-year-old {persona.job} who is {persona.traits}.
+Answer as {persona.name} in your own authentic voice. Be brief but creative and unique, and make each answer conversational.
+BE REALISTIC – do not be overly optimistic. Mimic real human behavior based on your persona, and give honest answers."""
+        conversations.append([
+            {"role": "system", "content": persona_card},
+            {"role": "user", "content": interview_prompt}
+        ])
+
+    interview_llm = _make_llm(SMALL_MODEL, ANSWER_MAX_TOKENS * num_questions + STRUCTURED_OUTPUT_OVERHEAD_TOKENS)
+    structured_llm = interview_llm.with_structured_output(PersonaAnswers)
+    persona_answers: List[List[str]] = [[] for _ in personas]
+    pending = list(range(len(personas)))
+    completed = 0
+
+    for attempt in range(LLM_MAX_ATTEMPTS):
+        failed = []
+        # Handle each persona as soon as it finishes so progress can be reported without waiting for the batch
+        async for k, result in structured_llm.abatch_as_completed(
+            [conversations[i] for i in pending],
+            config={"max_concurrency": MAX_CONCURRENCY},
+            return_exceptions=True
+        ):
+            i = pending[k]
+            if isinstance(result, Exception):
+                error = str(result)
+            elif result is None:
+                error = "LLM returned None"
+            elif len(result.answers) != num_questions:
+                error = f"Expected {num_questions} answers, got {len(result.answers)}"
+            else:
+                persona_answers[i] = result.answers
+                completed += 1
+                if on_progress:
+                    on_progress({
+                        "persona": personas[i].name,
+                        "completed": completed,
+                        "total": len(personas)
+                    })
+                continue
+
+            print(f"❌ Attempt {attempt+1} failed for {personas[i].name}: {error}")
+            # Retry with feedback so the model can correct itself
+            conversations[i] = conversations[i] + [{
+                "role": "user",
+                "content": f"Your previous output had an error: {error}. Fix it and return exactly {num_questions} answers, one per question, in order."
+            }]
+            failed.append(i)
+
+        pending = failed
+        if not pending:
+            break
+        if attempt + 1 < LLM_MAX_ATTEMPTS:
+            # Back off before re-sending failed personas, matching the persona retry schedule
+            await asyncio.sleep(min(max(2 ** attempt, RETRY_BACKOFF_MIN), RETRY_BACKOFF_MAX))
+    else:
+        raise RuntimeError(f"❗️Failed to interview {len(pending)} personas after {LLM_MAX_ATTEMPTS} attempts")
+
+    all_interviews = []
+    for i, (persona, answers) in enumerate(zip(personas, persona_answers)):
+        print(f"\n💬 Interview {i + 1}/{len(personas)} - {persona.name}")
+        history = []
+        for j, (question, answer) in enumerate(zip(questions, answers), 1):
+            print(f"Q{j}: {question}")
+            print(f"A: {answer}")
+            history.append({
+                "question": question,
+                "answer": answer
+            })
+        all_interviews.append({
+            'persona': persona,
+            'responses': history
+        })
+
+    return {"all_interviews": all_interviews}
+
+async def synthesis_node(state: InterviewState, config: RunnableConfig) -> Dict:
     """Synthesize insights from all interviews"""
     print("\n🧠 Analyzing all interviews...")
 
-    # Compile all responses in a structured format
-    interview_summary = f"Research Question: {state['research_question']}\n"
-    interview_summary += f"Target Demographic: {state['target_demographic']}\n"
-    interview_summary += f"Number of Interviews: {len(state['all_interviews'])}\n\n"
-
-    for i, interview in enumerate(state['all_interviews'], 1):
-        p = interview['persona']
-        interview_summary += f"Interview {i} - {p.name} ({p.age}, {p.job}):\n"
-        interview_summary += f"Persona Traits: {p.traits}\n"
-        for j, qa in enumerate(interview['responses'], 1):
-            interview_summary += f"Q{j}: {qa['question']}\n"
-            interview_summary += f"A{j}: {qa['answer']}\n"
-        interview_summary += "\n"
+    all_interviews = state.all_interviews
+    num_interviews = len(all_interviews)
+
+    # Compact payload: questions listed once, answers as a persona x question matrix
+    payload = {
+        "research_question": state.research_question,
+        "target_demographic": state.target_demographic,
+        "questions": state.interview_questions,
+        "personas": [
+            {"n": p.name, "a": p.age, "j": p.job, "t": p.traits}
+            for p in (interview['persona'] for interview in all_interviews)
+        ],
+        "answers_matrix": [
+            [qa['answer'] for qa in interview['responses']]
+            for interview in all_interviews
+        ]
+    }
+    interview_data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
 
-    synthesis_prompt_template = f"""Analyze these {len(state['all_interviews'])} user interviews about "{state['research_question']}" among {state['target_demographic']} and provide a concise yet comprehensive analysis:
+    synthesis_prompt_template = f"""Analyze these {num_interviews} user interviews about "{state.research_question}" among {state.target_demographic} and provide a concise yet comprehensive analysis:
 
 1. KEY THEMES: What patterns and common themes emerged across all interviews? Look for similarities in responses, shared concerns, and recurring topics.
 
@@ -164,85 +302,76 @@ def synthesis_node(state: InterviewState) -> Dict:
 
 Keep the analysis thorough but well-organized and actionable.
 
-Interview Data:
-{interview_summary}
+Interview Data (JSON): "personas" entries use n=name, a=age, j=job, t=traits. Row i of "answers_matrix" holds persona i's answers to "questions", in order.
+{interview_data}
 """
 
+    # Forward tokens to the caller (e.g. an SSE endpoint) while accumulating the full text
+    on_token = config.get("configurable", {}).get("on_synthesis_token")
     try:
-        synthesis = ask_ai(synthesis_prompt_template)
+        chunks = []
+        async for token in stream_synthesis(synthesis_prompt_template):
+            chunks.append(token)
+            if on_token:
+                on_token(token)
+        synthesis = "".join(chunks)
     except Exception as e:
         synthesis = f"Error during synthesis: {e}\n\nRaw interview data available for manual analysis."
 
     print("\n" + "="*60)
     print("🎯 COMPREHENSIVE RESEARCH INSIGHTS")
     print("="*60)
-    print(f"Research Topic: {state['research_question']}")
-    print(f"Demographic: {state['target_demographic']}")
-    print(f"Interviews Conducted: {len(state['all_interviews'])}")
+    print(f"Research Topic: {state.research_question}")
+    print(f"Demographic: {state.target_demographic}")
+    print(f"Interviews Conducted: {num_interviews}")
     print("-"*60)
     print(synthesis)
     print("="*60)
 
     return {"synthesis": synthesis}
 
-def interview_router(state: InterviewState) -> str:
-    """Route between continuing interviews or ending"""
-    if state['current_persona_index'] >= len(state['personas']):
-        return "synthesize"
-    else:
-        return "interview"
-
 def build_interview_workflow():
     """Build the complete interview workflow graph"""
     workflow = StateGraph(InterviewState)
 
     # Add all our specialized nodes
-    workflow.add_node("config", configuration_node)
-    workflow.add_node("personas", persona_generation_node)
-    workflow.add_node("interview", interview_node)
+    workflow.add_node("setup", setup_node)
+    workflow.add_node("interviews", interviews_node)
     workflow.add_node("synthesize", synthesis_node)
 
     # Define the workflow connections
-    workflow.set_entry_point("config")
-    workflow.add_edge("config", "personas")
-    workflow.add_edge("personas", "interview")
-
-    # Conditional routing based on interview progress
-    workflow.add_conditional_edges(
-        "interview",
-        interview_router,
-        {
-            "interview": "interview",    # Continue interviewing
-            "synthesize": "synthesize"   # All done, analyze results
-        }
-    )
+    workflow.set_entry_point("setup")
+    workflow.add_edge("setup", "interviews")
+    workflow.add_edge("interviews", "synthesize")
     workflow.add_edge("synthesize", END)
 
     return workflow.compile()
 
-def run_research_workflow(research_question: str, target_demographic: str):
-    """Execute the complete LangGraph research workflow"""
+async def run_research_workflow(
+    research_question: str,
+    target_demographic: str,
+    on_synthesis_token: Optional[Callable[[str], None]] = None,
+    on_interview_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+):
+    """Execute the complete LangGraph research workflow, optionally streaming interview progress and synthesis tokens"""
     workflow = build_interview_workflow()
 
     # Initialize state
-    initial_state = {
-        "research_question": research_question,
-        "target_demographic": target_demographic,
-        "num_interviews": DEFAULT_NUM_INTERVIEWS,
-        "num_questions": DEFAULT_NUM_QUESTIONS,
-        "interview_questions": [],
-        "personas": [],
-        "current_persona_index": 0,
-        "current_question_index": 0,
-        "current_interview_history": [],
-        "all_interviews": [],
-        "synthesis": ""
-    }
+    initial_state = InterviewState(
+        research_question=research_question,
+        target_demographic=target_demographic
+    )
 
     start_time = time.time()
     
     try:
-        final_state = workflow.invoke(initial_state, {"recursion_limit": 100})
+        final_state = await workflow.ainvoke(
+            initial_state,
+            {"configurable": {
+                "on_synthesis_token": on_synthesis_token,
+                "on_interview_progress": on_interview_progress
+            }}
+        )
         total_time = time.time() - start_time
         print(f"\n✅ Workflow complete! {len(final_state['all_interviews'])} interviews in {total_time:.1f}s")
         return final_state
@@ -7,7 +7,7 @@ import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +30,11 @@ class WorkflowStep(BaseModel):
     metadata: Dict[str, Any] = {}
     error_message: Optional[str] = None
     substeps: List['WorkflowStep'] = []
+    
+    # Serialized form reused by get_progress until the step changes
+    _cached_dict: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    # Monotonic start timestamp used for duration math (start_time stays for display)
+    _start_ns: Optional[int] = PrivateAttr(default=None)
 
 class WorkflowTracker:
     def __init__(self, session_id: str, research_question: str):
@@ -40,6 +45,9 @@ class WorkflowTracker:
         self.steps: List[WorkflowStep] = []
         self.current_step_index = 0
         self.total_steps = 0
+        # Bumped on every step mutation; lets pollers and get_progress skip unchanged work
+        self._version = 0
+        self._last_progress: Optional[tuple] = None
         
         # Initialize research workflow steps
         self._initialize_workflow_steps()
@@ -161,6 +169,27 @@ class WorkflowTracker:
             )
         ]
         self.total_steps = len(self.steps)
+        self._parent_steps: Dict[str, WorkflowStep] = {
+            substep.id: step for step in self.steps for substep in step.substeps
+        }
+        # Flat id -> step index over top-level steps and substeps for O(1) lookups
+        self._step_index: Dict[str, WorkflowStep] = {step.id: step for step in self.steps}
+        for step in self.steps:
+            self._step_index.update({substep.id: substep for substep in step.substeps})
+    
+    def _invalidate(self, step: WorkflowStep):
+        """Drop cached serializations for a step and its parent"""
+        self._version += 1
+        step._cached_dict = None
+        parent = self._parent_steps.get(step.id)
+        if parent:
+            parent._cached_dict = None
+    
+    def _step_dict(self, step: WorkflowStep) -> Dict[str, Any]:
+        """Serialize a step, reusing the cached dict while the step is unchanged"""
+        if step._cached_dict is None:
+            step._cached_dict = step.model_dump(mode="json")
+        return step._cached_dict
     
     def start_step(self, step_id: str, metadata: Dict[str, Any] = None) -> bool:
         """Start a workflow step"""
@@ -171,8 +200,10 @@ class WorkflowTracker:
         
         step.status = StepStatus.RUNNING
         step.start_time = datetime.now()
+        step._start_ns = time.monotonic_ns()
         if metadata:
             step.metadata.update(metadata)
+        self._invalidate(step)
         
         logger.info(f"Started step: {step.name}")
         return True
@@ -185,12 +216,12 @@ class WorkflowTracker:
         
         step.status = StepStatus.COMPLETED
         step.end_time = datetime.now()
-        if step.start_time:
-            delta = step.end_time - step.start_time
-            step.duration_ms = int(delta.total_seconds() * 1000)
+        if step._start_ns is not None:
+            step.duration_ms = (time.monotonic_ns() - step._start_ns) // 1_000_000
         
         if metadata:
             step.metadata.update(metadata)
+        self._invalidate(step)
         
         logger.info(f"Completed step: {step.name} ({step.duration_ms}ms)")
         return True
@@ -204,39 +235,48 @@ class WorkflowTracker:
         step.status = StepStatus.FAILED
         step.end_time = datetime.now()
         step.error_message = error_message
-        if step.start_time:
-            delta = step.end_time - step.start_time
-            step.duration_ms = int(delta.total_seconds() * 1000)
+        if step._start_ns is not None:
+            step.duration_ms = (time.monotonic_ns() - step._start_ns) // 1_000_000
+        self._invalidate(step)
         
         logger.error(f"Failed step: {step.name} - {error_message}")
         return True
     
     def _find_step(self, step_id: str) -> Optional[WorkflowStep]:
         """Find a step by ID (including substeps)"""
-        for step in self.steps:
-            if step.id == step_id:
-                return step
-            for substep in step.substeps:
-                if substep.id == step_id:
-                    return substep
-        return None
+        return self._step_index.get(step_id)
+    
+    @property
+    def version(self) -> int:
+        """Monotonic change counter, suitable for an ETag"""
+        return self._version
     
     def get_progress(self) -> Dict[str, Any]:
-        """Get current workflow progress"""
-        completed_steps = sum(1 for step in self.steps if step.status == StepStatus.COMPLETED)
-        running_steps = sum(1 for step in self.steps if step.status == StepStatus.RUNNING)
-        failed_steps = sum(1 for step in self.steps if step.status == StepStatus.FAILED)
-        
-        progress_percentage = (completed_steps / self.total_steps) * 100 if self.total_steps > 0 else 0
+        """
+        Get current workflow progress as JSON-ready values.
+        Returns a shallow copy; the nested step dicts are cached and shared, so don't mutate them.
+        """
+        if self._last_progress and self._last_progress[0] == self._version:
+            return dict(self._last_progress[1])
         
+        # Single pass over the steps for all counters and the current step
+        completed_steps = running_steps = failed_steps = 0
         current_step = None
         for step in self.steps:
-            if step.status == StepStatus.RUNNING:
-                current_step = step
-                break
+            if step.status == StepStatus.COMPLETED:
+                completed_steps += 1
+            elif step.status == StepStatus.RUNNING:
+                running_steps += 1
+                if current_step is None:
+                    current_step = step
+            elif step.status == StepStatus.FAILED:
+                failed_steps += 1
+        
+        progress_percentage = (completed_steps / self.total_steps) * 100 if self.total_steps > 0 else 0
         
-        return {
+        progress = {
             "workflow_id": self.workflow_id,
+            "version": self._version,
             "session_id": self.session_id,
             "research_question": self.research_question,
             "progress_percentage": round(progress_percentage, 1),
@@ -244,10 +284,12 @@ class WorkflowTracker:
             "completed_steps": completed_steps,
             "running_steps": running_steps,
             "failed_steps": failed_steps,
-            "current_step": current_step.dict() if current_step else None,
-            "start_time": self.start_time,
-            "steps": [step.dict() for step in self.steps]
+            "current_step": self._step_dict(current_step) if current_step else None,
+            "start_time": self.start_time.isoformat(),
+            "steps": [self._step_dict(step) for step in self.steps]
         }
+        self._last_progress = (self._version, progress)
+        return dict(progress)
     
     def get_current_step(self) -> Optional[WorkflowStep]:
         """Get the currently running step"""